@@ -8,6 +8,15 @@ import { wrapper } from 'axios-cookiejar-support';
 import { CookieJar } from 'tough-cookie';
 import * as cheerio from 'cheerio';
 
+// Verbose request/session tracing. Off by default so production requests
+// don't pay for building and writing log payloads; set GOLESTAN_DEBUG=1 to
+// enable it while diagnosing login or scraping issues.
+const DEBUG_LOGGING = /^(1|true)$/i.test(process.env.GOLESTAN_DEBUG ?? '');
+
+function debugLog(...args: unknown[]): void {
+  if (DEBUG_LOGGING) console.log(...args);
+}
+
 export interface CourseEnrollment {
   courseCode: string;
   courseName: string;
@@ -80,7 +89,7 @@ function extractAspNetFields(html: string): AspNetFields {
     $('input[name="__EVENTVALIDATION"]').attr('value') ?? '';
   const ticket = $('input[name="TicketTextBox"]').attr('value') ?? null;
 
-  console.log('[GolestanClient][extractAspNetFields]', {
+  debugLog('[GolestanClient][extractAspNetFields]', {
     viewStatePresent: !!viewState,
     viewStateGeneratorPresent: !!viewStateGenerator,
     eventValidationPresent: !!eventValidation,
@@ -126,9 +135,21 @@ function toNumber(raw: string | null | undefined, defaultValue = 0): number {
   return n == null ? defaultValue : n;
 }
 
+// Compiled `NAME = '...';` patterns, one per variable name. The same few
+// dozen names are extracted for every semester page of every student.
+const jsVarPatterns = new Map<string, RegExp>();
+
+function getJsVarPattern(varName: string): RegExp {
+  let pattern = jsVarPatterns.get(varName);
+  if (!pattern) {
+    pattern = new RegExp(`${varName}\\s*=\\s*'([^']*)';`);
+    jsVarPatterns.set(varName, pattern);
+  }
+  return pattern;
+}
+
 function extractJsVar(html: string, varName: string): string {
-  const pattern = new RegExp(`${varName}\\s*=\\s*'([^']*)';`);
-  const match = html.match(pattern);
+  const match = html.match(getJsVarPattern(varName));
   return match?.[1] ?? '';
 }
 
@@ -273,11 +294,7 @@ function parseStudentInfoFromHtml(html: string, username: string): Student {
 
   const scriptText = script.text();
 
-  const extractVar = (varName: string): string => {
-    const pattern = new RegExp(`${varName}\\s*=\\s*'([^']*)';`);
-    const match = scriptText.match(pattern);
-    return match?.[1] ?? '';
-  };
+  const extractVar = (varName: string): string => extractJsVar(scriptText, varName);
 
   const name = extractVar('F51851');
   const fatherName = extractVar('F34501');
@@ -395,13 +412,14 @@ class GolestanClient {
   }
 
   private async logSessionCookies(label: string): Promise<void> {
+    if (!DEBUG_LOGGING) return;
     try {
       const cookies = await this.jar.getCookies(this.baseUrl);
       const hasSession = cookies.some(c => c.key === 'ASP.NET_SessionId');
       const hasLt = cookies.some(c => c.key === 'lt');
       const hasU = cookies.some(c => c.key === 'u');
 
-      console.log('[GolestanClient][session]', label, {
+      debugLog('[GolestanClient][session]', label, {
         aspNetSessionPresent: hasSession,
         ltPresent: hasLt,
         uPresent: hasU,
@@ -423,7 +441,7 @@ class GolestanClient {
       headers: { ...this.defaultHeaders, ...(config.headers || {}) },
     };
 
-    console.log('[GolestanClient][request]', {
+    debugLog('[GolestanClient][request]', {
       method,
       url,
       hasData: typeof finalConfig.data !== 'undefined',
@@ -439,7 +457,7 @@ class GolestanClient {
         throw new Error(`Unsupported HTTP method: ${method}`);
       }
 
-      console.log('[GolestanClient][response]', {
+      debugLog('[GolestanClient][response]', {
         method,
         url,
         status: response.status,
@@ -538,7 +556,7 @@ class GolestanClient {
 
       const captchaBuffer = Buffer.from(captchaResp.data);
       const captchaText = await this.captchaSolver(captchaBuffer);
-      console.log('[GolestanClient][captcha]', {
+      debugLog('[GolestanClient][captcha]', {
         attempt,
         captchaText,
       });
@@ -1,3 +1,4 @@
+import { lazy, Suspense } from "react";
 import { Toaster } from "@/components/ui/toaster";
 import { Toaster as Sonner } from "@/components/ui/sonner";
 import { TooltipProvider } from "@/components/ui/tooltip";
@@ -8,10 +9,12 @@ import { AuthProvider } from "@/contexts/AuthContext";
 import { TourProvider, useTour } from "@/contexts/TourContext";
 import GuidedTour from "@/components/GuidedTour";
 import Index from "./pages/Index";
-import Donate from "./pages/Donate";
-import About from "./pages/About";
-import NotFound from "./pages/NotFound";
-import AuthPage from "./pages/AuthPage";
+
+// Secondary pages are split out so the planner's first paint doesn't wait on them
+const Donate = lazy(() => import("./pages/Donate"));
+const About = lazy(() => import("./pages/About"));
+const NotFound = lazy(() => import("./pages/NotFound"));
+const AuthPage = lazy(() => import("./pages/AuthPage"));
 
 const queryClient = new QueryClient();
 
@@ -29,16 +32,18 @@ const App = () => (
         <BrowserRouter>
           <AuthProvider>
             <TourProvider>
-              <Routes>
-                {/* Home page is publicly accessible; schedule grid and sidebar handle auth gating themselves */}
-                <Route path="/" element={<Index />} />
-                <Route path="/donate" element={<Donate />} />
-                <Route path="/about" element={<About />} />
-                {/* Auth page (login / signup) remains public */}
-                <Route path="/auth" element={<AuthPage />} />
-                {/* ADD ALL CUSTOM ROUTES ABOVE THE CATCH-ALL "*" ROUTE */}
-                <Route path="*" element={<NotFound />} />
-              </Routes>
+              <Suspense fallback={null}>
+                <Routes>
+                  {/* Home page is publicly accessible; schedule grid and sidebar handle auth gating themselves */}
+                  <Route path="/" element={<Index />} />
+                  <Route path="/donate" element={<Donate />} />
+                  <Route path="/about" element={<About />} />
+                  {/* Auth page (login / signup) remains public */}
+                  <Route path="/auth" element={<AuthPage />} />
+                  {/* ADD ALL CUSTOM ROUTES ABOVE THE CATCH-ALL "*" ROUTE */}
+                  <Route path="*" element={<NotFound />} />
+                </Routes>
+              </Suspense>
               {/* Guided tour lives at the app root so it persists across sheets/sidebars */}
               <TourHost />
             </TourProvider>
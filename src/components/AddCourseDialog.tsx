@@ -23,6 +23,7 @@ import {
 } from '@/components/ui/select';
 import { toast } from 'sonner';
 import { Course, WeekType, Gender, CourseType, CourseGroup, DAYS } from '@/types/course';
+import { createLocalId } from '@/lib/utils';
 
 interface AddCourseDialogProps {
   onAddCourse: (course: Course) => void;
@@ -143,9 +144,10 @@ const AddCourseDialog = ({ onAddCourse }: AddCourseDialogProps) => {
       toast.success(t('addCourse.editSuccess'), { description: trimmedName });
     } else {
       // Create a new custom course
+      const localId = createLocalId();
       const newCourse: Course = {
-        id: `custom_${Date.now()}`,
-        courseId: courseId || `C${Date.now()}`,
+        id: `custom_${localId}`,
+        courseId: courseId || `C${localId}`,
         name: trimmedName,
         instructor: trimmedInstructor,
         credits,
@@ -1,9 +1,6 @@
 import { useState } from 'react';
 import { Calendar, Download, Printer } from 'lucide-react';
 import { useTranslation } from 'react-i18next';
-import { jsPDF } from 'jspdf';
-import autoTable from 'jspdf-autotable';
-import { VAZIRMATN_REGULAR_TTF_BASE64 } from '@/lib/fonts/vazirmatn';
 import {
   Dialog,
   DialogContent,
@@ -22,14 +19,24 @@ import {
   TableRow,
 } from '@/components/ui/table';
 import { useSchedule } from '@/contexts/ScheduleContext';
+import type { Course } from '@/types/course';
 import { toast } from 'sonner';
 
 const ExamScheduleDialog = () => {
   const { selectedCourses } = useSchedule();
   const { t, i18n } = useTranslation();
 
-  const coursesWithExam = selectedCourses.filter(c => c.examDate);
-  const coursesWithoutExam = selectedCourses.filter(c => !c.examDate);
+  // Split courses by whether they have an exam date in a single pass
+  const coursesWithExam: Course[] = [];
+  const coursesWithoutExam: Course[] = [];
+  for (const c of selectedCourses) {
+    if (c.examDate) coursesWithExam.push(c);
+    else coursesWithoutExam.push(c);
+  }
+
+  // Resolve fallback labels once rather than per course
+  const noExamTimeLabel = t('examDialog.noExamTime');
+  const noLocationLabel = t('examDialog.noLocation');
 
   // Sort exams by date
   const exams = coursesWithExam
@@ -40,21 +47,25 @@ const ExamScheduleDialog = () => {
       instructor: c.instructor,
       description: c.description,
       date: c.examDate,
-      time: c.examTime || t('examDialog.noExamTime'),
-      location: c.sessions[0]?.location || t('examDialog.noLocation'),
+      time: c.examTime || noExamTimeLabel,
+      location: c.sessions[0]?.location || noLocationLabel,
       credits: c.credits,
     }))
     .sort((a, b) => (a.date || '').localeCompare(b.date || ''));
 
-  // Find conflicting exams (same date & time)
+  // Find conflicting exams (same date & time) by bucketing on a date|time key
+  const examsBySlot = new Map<string, string[]>();
+  exams.forEach(exam => {
+    if (exam.time === 'اعلام نشده') return;
+    const key = `${exam.date}|${exam.time}`;
+    const ids = examsBySlot.get(key);
+    if (ids) ids.push(exam.id);
+    else examsBySlot.set(key, [exam.id]);
+  });
+
   const conflictingIds = new Set<string>();
-  exams.forEach((exam, i) => {
-    exams.forEach((other, j) => {
-      if (i !== j && exam.date === other.date && exam.time === other.time && exam.time !== 'اعلام نشده') {
-        conflictingIds.add(exam.id);
-        conflictingIds.add(other.id);
-      }
-    });
+  examsBySlot.forEach(ids => {
+    if (ids.length > 1) ids.forEach(id => conflictingIds.add(id));
   });
 
   const handleExport = async () => {
@@ -64,6 +75,15 @@ const ExamScheduleDialog = () => {
     }
 
     try {
+      // The PDF stack and the embedded font are large and only needed here,
+      // so they are loaded on first export instead of with the app bundle
+      const [{ jsPDF }, { default: autoTable }, { VAZIRMATN_REGULAR_TTF_BASE64 }] =
+        await Promise.all([
+          import('jspdf'),
+          import('jspdf-autotable'),
+          import('@/lib/fonts/vazirmatn'),
+        ]);
+
       const pdf = new jsPDF({
         orientation: 'landscape',
         unit: 'mm',
@@ -153,11 +173,10 @@ const ExamScheduleDialog = () => {
       );
 
       // Mark rows that have exam conflicts (same date & time)
-      const conflictRowIndices = exams
-        .map((exam, index) =>
-          conflictingIds.has(exam.id) ? index : -1,
-        )
-        .filter(index => index !== -1);
+      const conflictRowIndices = new Set<number>();
+      exams.forEach((exam, index) => {
+        if (conflictingIds.has(exam.id)) conflictRowIndices.add(index);
+      });
 
       autoTable(pdf, {
         head,
@@ -191,7 +210,7 @@ const ExamScheduleDialog = () => {
 
           if (
             data.section === 'body' &&
-            conflictRowIndices.includes(data.row.index)
+            conflictRowIndices.has(data.row.index)
           ) {
             // Highlight conflicting exam rows
             data.cell.styles.fillColor = [254, 226, 226]; // red-100
@@ -53,10 +53,11 @@ const LoginAuth = () => {
 
   const validate = useMemo(() => {
     const errors: Partial<AuthFormValues> = {};
+    const trimmedEmail = values.email.trim();
 
-    if (!values.email.trim()) {
+    if (!trimmedEmail) {
       errors.email = t('auth.fieldErrorEmailRequired');
-    } else if (!emailRegex.test(values.email.trim())) {
+    } else if (!emailRegex.test(trimmedEmail)) {
       errors.email = t('auth.fieldErrorEmailInvalid');
     }
 
@@ -65,9 +66,10 @@ const LoginAuth = () => {
     }
 
     if (isSignup) {
-      if (!values.fullName.trim()) {
+      const trimmedName = values.fullName.trim();
+      if (!trimmedName) {
         errors.fullName = t('auth.fieldErrorNameRequired');
-      } else if (values.fullName.trim().length < 3) {
+      } else if (trimmedName.length < 3) {
         errors.fullName = t('auth.fieldErrorNameShort');
       }
 
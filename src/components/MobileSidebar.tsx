@@ -25,7 +25,8 @@ import { Gender, Course } from '@/types/course';
 import { useSchedule } from '@/contexts/ScheduleContext';
 import { toast } from 'sonner';
 import { useGolestanData } from '@/hooks/useGolestanData';
-import { normalizeText } from '@/lib/textNormalizer';
+import { buildCourseSearchIndex, normalizeText } from '@/lib/textNormalizer';
+import { partitionCourses } from '@/lib/utils';
 import { useTranslation } from 'react-i18next';
 
 interface MobileSidebarProps {
@@ -49,6 +50,11 @@ const MobileSidebar = ({ isOpen, onOpenChange }: MobileSidebarProps) => {
 
   const normalizedQuery = useMemo(() => normalizeText(searchQuery), [searchQuery]);
 
+  const searchTextByCourse = useMemo(
+    () => buildCourseSearchIndex(allCourses),
+    [allCourses],
+  );
+
   const filteredCourses = useMemo(() => {
     return allCourses.filter(course => {
       const isCustom = course.departmentId === 'custom';
@@ -58,15 +64,8 @@ const MobileSidebar = ({ isOpen, onOpenChange }: MobileSidebarProps) => {
         if (course.departmentId !== selectedDepartment) return false;
       }
 
-      const normName = normalizeText(course.name);
-      const normInstructor = normalizeText(course.instructor);
-      const normCode = normalizeText(course.courseId);
-
       const matchesSearch =
-        !normalizedQuery ||
-        normName.includes(normalizedQuery) ||
-        normInstructor.includes(normalizedQuery) ||
-        normCode.includes(normalizedQuery);
+        !normalizedQuery || searchTextByCourse.get(course)!.includes(normalizedQuery);
 
       const matchesGender = gender === 'all' || course.gender === gender;
       const matchesGeneral = !showGeneralOnly || course.isGeneral;
@@ -74,11 +73,11 @@ const MobileSidebar = ({ isOpen, onOpenChange }: MobileSidebarProps) => {
 
       return matchesSearch && matchesGender && matchesGeneral && matchesFull;
     });
-  }, [normalizedQuery, gender, showGeneralOnly, hideFull, selectedDepartment, allCourses]);
+  }, [normalizedQuery, gender, showGeneralOnly, hideFull, selectedDepartment, allCourses, searchTextByCourse]);
 
-  const customCoursesList = filteredCourses.filter(c => c.departmentId === 'custom');
-  const availableToTake = filteredCourses.filter(
-    c => c.category === 'available' && c.departmentId !== 'custom',
+  const { custom: customCoursesList, available: availableToTake } = useMemo(
+    () => partitionCourses(filteredCourses),
+    [filteredCourses],
   );
 
   const handleSave = () => {
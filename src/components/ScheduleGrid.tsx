@@ -1,5 +1,5 @@
 import React, { useMemo, useCallback, useState } from 'react';
-import { DAYS, ScheduledSession } from '@/types/course';
+import { DAYS, TIME_SLOTS, ScheduledSession } from '@/types/course';
 import { useSchedule } from '@/contexts/ScheduleContext';
 import { useSettings } from '@/contexts/SettingsContext';
 import { useResponsive } from '@/hooks/use-responsive';
@@ -8,8 +8,10 @@ import { cn } from '@/lib/utils';
 import { useTranslation } from 'react-i18next';
 import { Z_INDEX } from '@/lib/constants';
 
-// ✅ Full possible time range (7:00 to 21:00) used as a base template
-const ALL_TIME_SLOTS = Array.from({ length: 14 }, (_, i) => 7 + i);
+// ✅ Hour labels ("07:00", "08:00", ...) formatted once instead of per row render
+const HOUR_LABELS: Record<number, string> = Object.fromEntries(
+  Array.from({ length: 24 }, (_, hour) => [hour, `${hour.toString().padStart(2, '0')}:00`]),
+);
 
 type SessionLayout = {
   offsetPercent: number; // 0 = no offset, 0.1 = 10% of column width
@@ -224,7 +226,7 @@ const ScheduleGrid = () => {
   // Mobile: only hours that actually have classes, padded by 1 hour on each side
   const timeSlots = useMemo(() => {
     if (!isMobile) {
-      return ALL_TIME_SLOTS;
+      return TIME_SLOTS;
     }
 
     if (scheduledSessions.length === 0) {
@@ -269,6 +271,17 @@ const ScheduleGrid = () => {
     return DAY_GROUPS[activeDayGroup].days;
   }, [isMobile, activeDayGroup]);
 
+  // Day header labels only change with the language (via `t`) or the mobile
+  // layout, not on every render
+  const dayLabels = useMemo(
+    () =>
+      DAYS.map((_, dayIndex) => {
+        const label = t(`days.${dayIndex}`);
+        return isMobile ? label.replace('\u200c', '') : label;
+      }),
+    [t, isMobile],
+  );
+
   // Pre-index scheduled sessions for efficient lookups
   const slotsIndex = useMemo(() => {
     const byDayTime = new Map<string, ScheduledSession[]>();
@@ -314,6 +327,26 @@ const ScheduleGrid = () => {
     [slotsIndex],
   );
 
+  // Start/end minutes of real and hovered sessions, grouped by day
+  const occupiedRangesByDay = useMemo(() => {
+    const byDay = new Map<number, Array<[number, number]>>();
+    const addSession = (session: ScheduledSession) => {
+      const range: [number, number] = [
+        timeToMinutes(session.startTime),
+        timeToMinutes(session.endTime),
+      ];
+      const list = byDay.get(session.day);
+      if (list) {
+        list.push(range);
+      } else {
+        byDay.set(session.day, [range]);
+      }
+    };
+    scheduledSessions.forEach(addSession);
+    hoveredSessions.forEach(addSession);
+    return byDay;
+  }, [scheduledSessions, hoveredSessions]);
+
   /**
    * Returns true when this cell (day, time) is within the vertical span
    * of any session that started earlier on the same day – including both
@@ -321,21 +354,15 @@ const ScheduleGrid = () => {
    */
   const isCellOccupiedByPrevious = useCallback(
     (day: number, time: number): boolean => {
-      const daySessions = slotsIndex.byDay.get(day) ?? [];
-      const hoveredDaySessions = hoveredSessions.filter(
-        (session) => session.day === day,
-      );
-      const allSessions = [...daySessions, ...hoveredDaySessions];
+      const ranges = occupiedRangesByDay.get(day);
+      if (!ranges) return false;
 
       const currentMinutes = timeToMinutes(time);
-
-      return allSessions.some((session) => {
-        const start = timeToMinutes(session.startTime);
-        const end = timeToMinutes(session.endTime);
-        return start < currentMinutes && end > currentMinutes;
-      });
+      return ranges.some(
+        ([start, end]) => start < currentMinutes && end > currentMinutes,
+      );
     },
-    [slotsIndex, hoveredSessions],
+    [occupiedRangesByDay],
   );
 
   const getHoveredStartSessionsForSlot = useCallback(
@@ -375,10 +402,6 @@ const ScheduleGrid = () => {
     return null;
   }, [slotsIndex, timeSlots]);
 
-  const formatTime = (hour: number): string => {
-    return `${hour.toString().padStart(2, '0')}:00`;
-  };
-
   // Responsive sizing
   const ROW_HEIGHT = isMobile ? 52 : isTablet ? 50 : 52;
   const HEADER_HEIGHT = isMobile ? 36 : 36;
@@ -457,7 +480,6 @@ const ScheduleGrid = () => {
             </div>
 
             {visibleDays.map((dayIndex, colIndex) => {
-              const label = t(`days.${dayIndex}`);
               return (
                 <div
                   key={`header-${dayIndex}`}
@@ -476,7 +498,7 @@ const ScheduleGrid = () => {
                     zIndex: Z_INDEX.gridHeader,
                   }}
                 >
-                  {isMobile ? label.replace('\u200c', '') : label}
+                  {dayLabels[dayIndex]}
                 </div>
               );
             })}
@@ -500,7 +522,7 @@ const ScheduleGrid = () => {
                     ...(isRtl ? { right: 0 } : { left: 0 }),
                   }}
                 >
-                  <span>{formatTime(time)}</span>
+                  <span>{HOUR_LABELS[time]}</span>
                 </div>
 
                 {visibleDays.map((dayIndex, colIndex) => {
@@ -35,7 +35,8 @@ import { Gender, Course } from '@/types/course';
 import { useSchedule } from '@/contexts/ScheduleContext';
 import { toast } from 'sonner';
 import { useGolestanData } from '@/hooks/useGolestanData';
-import { normalizeText } from '@/lib/textNormalizer';
+import { buildCourseSearchIndex, normalizeText } from '@/lib/textNormalizer';
+import { partitionCourses } from '@/lib/utils';
 import DepartmentCombobox from './DepartmentCombobox';
 
 interface VirtualizedCourseListProps {
@@ -112,6 +113,11 @@ const Sidebar = () => {
 
   const normalizedQuery = useMemo(() => normalizeText(searchQuery), [searchQuery]);
 
+  const searchTextByCourse = useMemo(
+    () => buildCourseSearchIndex(allCourses),
+    [allCourses],
+  );
+
   const filteredCourses = useMemo(() => {
     return allCourses.filter(course => {
       const isCustom = course.departmentId === 'custom';
@@ -122,15 +128,8 @@ const Sidebar = () => {
         if (course.departmentId !== selectedDepartment) return false;
       }
 
-      const normName = normalizeText(course.name);
-      const normInstructor = normalizeText(course.instructor);
-      const normCode = normalizeText(course.courseId);
-
       const matchesSearch =
-        !normalizedQuery ||
-        normName.includes(normalizedQuery) ||
-        normInstructor.includes(normalizedQuery) ||
-        normCode.includes(normalizedQuery);
+        !normalizedQuery || searchTextByCourse.get(course)!.includes(normalizedQuery);
 
       const matchesGender = gender === 'all' || course.gender === gender;
       const matchesGeneral = !showGeneralOnly || course.isGeneral;
@@ -150,6 +149,7 @@ const Sidebar = () => {
     });
   }, [
     allCourses,
+    searchTextByCourse,
     selectedDepartment,
     normalizedQuery,
     gender,
@@ -159,13 +159,11 @@ const Sidebar = () => {
     timeTo,
   ]);
 
-  const customCoursesList = filteredCourses.filter(c => c.departmentId === 'custom');
-  const availableToTake = filteredCourses.filter(
-    c => c.category === 'available' && c.departmentId !== 'custom',
-  );
-  const otherCourses = filteredCourses.filter(
-    c => c.category === 'other' && c.departmentId !== 'custom',
-  );
+  const {
+    custom: customCoursesList,
+    available: availableToTake,
+    other: otherCourses,
+  } = useMemo(() => partitionCourses(filteredCourses), [filteredCourses]);
 
   const handleSave = () => {
     if (selectedCourses.length === 0) {
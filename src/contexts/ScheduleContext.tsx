@@ -7,6 +7,7 @@ import { convertGolestanCourseToAppCourse } from '@/lib/converters';
 import { useTranslation } from 'react-i18next';
 import { useAuth } from '@/contexts/AuthContext';
 import { fetchUserSchedules, saveUserSchedule, deleteUserSchedule } from '@/services/scheduleService';
+import { createLocalId } from '@/lib/utils';
 
 export interface SavedSchedule {
   id: string;
@@ -61,6 +62,65 @@ interface ScheduleContextType {
 
 const ScheduleContext = createContext<ScheduleContextType | undefined>(undefined);
 
+// Last serialized value written per localStorage key. State updates that
+// serialize to the same JSON (including the first effect run after loading
+// from storage) skip the synchronous setItem call.
+const lastPersisted = new Map<string, string>();
+
+// Writes are deferred and coalesced: rapid successive updates (e.g. hovering
+// and toggling courses) only serialize and store the newest value per key.
+const PERSIST_DELAY_MS = 300;
+const pendingWrites = new Map<string, unknown>();
+let flushTimer: number | null = null;
+
+const writeToStorage = (key: string, value: unknown) => {
+  try {
+    const serialized = JSON.stringify(value);
+    if (lastPersisted.get(key) === serialized) return;
+    window.localStorage.setItem(key, serialized);
+    lastPersisted.set(key, serialized);
+  } catch {
+    // ignore storage errors
+  }
+};
+
+const flushPendingWrites = () => {
+  if (flushTimer !== null) {
+    window.clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  pendingWrites.forEach((value, key) => writeToStorage(key, value));
+  pendingWrites.clear();
+};
+
+const persistToStorage = (key: string, value: unknown) => {
+  if (typeof window === 'undefined') return;
+  pendingWrites.set(key, value);
+  if (flushTimer === null) {
+    flushTimer = window.setTimeout(flushPendingWrites, PERSIST_DELAY_MS);
+  }
+};
+
+if (typeof window !== 'undefined') {
+  // Make sure nothing queued is lost when the tab is closed or hidden. Mobile
+  // browsers may kill a backgrounded tab without firing pagehide, so also
+  // flush as soon as the page stops being visible.
+  window.addEventListener('pagehide', flushPendingWrites);
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') flushPendingWrites();
+  });
+
+  // Another tab wrote (or cleared) storage, so what we last persisted is no
+  // longer what is stored; forget it so our next write is not skipped.
+  window.addEventListener('storage', (event) => {
+    if (event.key === null) {
+      lastPersisted.clear();
+    } else {
+      lastPersisted.delete(event.key);
+    }
+  });
+}
+
 export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
   const { t } = useTranslation();
   const { user } = useAuth();
@@ -71,6 +131,7 @@ export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ chil
     try {
       const raw = window.localStorage.getItem('golestan_active_session');
       if (!raw) return [];
+      lastPersisted.set('golestan_active_session', raw);
       const parsed = JSON.parse(raw);
       if (!Array.isArray(parsed)) return [];
       return parsed as Course[];
@@ -87,6 +148,7 @@ export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ chil
     try {
       const raw = window.localStorage.getItem('golestan-custom-courses');
       if (!raw) return [];
+      lastPersisted.set('golestan-custom-courses', raw);
       const parsed = JSON.parse(raw);
       if (!Array.isArray(parsed)) return [];
       return parsed as Course[];
@@ -100,6 +162,7 @@ export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ chil
     try {
       const raw = window.localStorage.getItem('golestan_saved_schedules');
       if (!raw) return [];
+      lastPersisted.set('golestan_saved_schedules', raw);
       const parsed = JSON.parse(raw);
       if (!Array.isArray(parsed)) return [];
       return parsed as SavedSchedule[];
@@ -148,32 +211,17 @@ export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ chil
 
   // Persist custom courses to localStorage
   useEffect(() => {
-    if (typeof window === 'undefined') return;
-    try {
-      window.localStorage.setItem('golestan-custom-courses', JSON.stringify(customCourses));
-    } catch {
-      // ignore storage errors
-    }
+    persistToStorage('golestan-custom-courses', customCourses);
   }, [customCourses]);
 
   // Persist active session (selected courses) to localStorage
   useEffect(() => {
-    if (typeof window === 'undefined') return;
-    try {
-      window.localStorage.setItem('golestan_active_session', JSON.stringify(selectedCourses));
-    } catch {
-      // ignore storage errors
-    }
+    persistToStorage('golestan_active_session', selectedCourses);
   }, [selectedCourses]);
 
   // Persist saved schedules to localStorage
   useEffect(() => {
-    if (typeof window === 'undefined') return;
-    try {
-      window.localStorage.setItem('golestan_saved_schedules', JSON.stringify(savedSchedules));
-    } catch {
-      // ignore storage errors
-    }
+    persistToStorage('golestan_saved_schedules', savedSchedules);
   }, [savedSchedules]);
 
   // Convert raw Golestan courses to app Course model
@@ -186,7 +234,10 @@ export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ chil
   }, [flattenedCourses]);
 
   // All available courses (custom first, then API)
+  // Consumers only read this list, so the API array is shared as-is when
+  // there are no custom courses instead of copying thousands of entries
   const allCourses = useMemo(() => {
+    if (customCourses.length === 0) return apiCourses;
     return [...customCourses, ...apiCourses];
   }, [apiCourses, customCourses]);
 
@@ -196,6 +247,12 @@ export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ chil
     [selectedCourses],
   );
 
+  // Hashed membership for isCourseSelected, which every sidebar row calls
+  const selectedCourseIdSet = useMemo(
+    () => new Set(selectedCourseIds),
+    [selectedCourseIds],
+  );
+
   // Flatten sessions for grid rendering
   const scheduledSessions = useMemo((): ScheduledSession[] => {
     return selectedCourses.flatMap(course =>
@@ -223,9 +280,9 @@ export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ chil
   // Check if a course is selected
   const isCourseSelected = useCallback(
     (courseId: string) => {
-      return selectedCourseIds.includes(courseId);
+      return selectedCourseIdSet.has(courseId);
     },
-    [selectedCourseIds],
+    [selectedCourseIdSet],
   );
 
   // Check for conflicts with a new course using core scheduler logic
@@ -314,6 +371,8 @@ export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ chil
     setHoveredCourseId(null);
     if (typeof window !== 'undefined') {
       window.localStorage.removeItem('golestan_active_session');
+      pendingWrites.delete('golestan_active_session');
+      lastPersisted.delete('golestan_active_session');
     }
   }, []);
 
@@ -331,13 +390,13 @@ export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ chil
   // Toggle course (add/remove)
   const toggleCourse = useCallback(
     (course: Course) => {
-      if (selectedCourseIds.includes(course.id)) {
+      if (selectedCourseIdSet.has(course.id)) {
         removeCourse(course.id);
       } else {
         addCourse(course);
       }
     },
-    [selectedCourseIds, addCourse, removeCourse],
+    [selectedCourseIdSet, addCourse, removeCourse],
   );
 
   // Add a custom course
@@ -392,11 +451,11 @@ export const ScheduleProvider: React.FC<{ children: React.ReactNode }> = ({ chil
       }
 
       // Guest: localStorage only (previous behaviour)
-      const now = Date.now();
+      const id = createLocalId();
       const newSchedule: SavedSchedule = {
-        id: now.toString(),
+        id,
         name: trimmedName,
-        createdAt: now,
+        createdAt: Number(id),
         courses: coursesSnapshot,
       };
 
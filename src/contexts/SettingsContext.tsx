@@ -61,54 +61,72 @@ const defaultSettings: StoredSettings = {
   version: SETTINGS_VERSION,
 };
 
-const loadInitialSettings = (): StoredSettings => {
+interface InitialSettings {
+  settings: StoredSettings;
+  /** True when nothing usable was stored and the defaults should be persisted. */
+  isDefault: boolean;
+}
+
+/**
+ * Read and validate persisted settings. Called once per provider mount;
+ * every piece of state below is seeded from the same result.
+ */
+const loadInitialSettings = (): InitialSettings => {
   if (typeof window === 'undefined') {
-    return defaultSettings;
+    return { settings: defaultSettings, isDefault: false };
   }
   try {
     const stored = window.localStorage.getItem(STORAGE_KEY);
     if (!stored) {
-      return defaultSettings;
+      return { settings: defaultSettings, isDefault: true };
     }
     const parsed: StoredSettings = JSON.parse(stored);
+    // If settings are from an older version, reset to new defaults
     if (!parsed.version || parsed.version !== SETTINGS_VERSION) {
-      return defaultSettings;
+      return { settings: defaultSettings, isDefault: true };
     }
     return {
-      ...defaultSettings,
-      ...parsed,
+      settings: {
+        ...defaultSettings,
+        ...parsed,
+      },
+      isDefault: false,
     };
-  } catch {
-    return defaultSettings;
+  } catch (e) {
+    console.error('Failed to load settings:', e);
+    return { settings: defaultSettings, isDefault: false };
   }
 };
 
+const applyDocumentLanguage = (lang: Language) => {
+  if (typeof document === 'undefined') return;
+  document.documentElement.dir = lang === 'fa' ? 'rtl' : 'ltr';
+  document.documentElement.lang = lang === 'fa' ? 'fa' : 'en';
+};
+
 export const SettingsProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
-  const [fontSize, setFontSizeState] = useState<FontSize>(
-    () => loadInitialSettings().fontSize,
-  );
-  const [themeMode, setThemeModeState] = useState<ThemeMode>(
-    () => loadInitialSettings().themeMode,
-  );
+  const [initialSettings] = useState(loadInitialSettings);
+  const initial = initialSettings.settings;
+
+  const [fontSize, setFontSizeState] = useState<FontSize>(initial.fontSize);
+  const [themeMode, setThemeModeState] = useState<ThemeMode>(initial.themeMode);
   const [showGridLines, setShowGridLinesState] = useState<boolean>(
-    () => loadInitialSettings().showGridLines,
-  );
-  const [language, setLanguageState] = useState<Language>(
-    () => loadInitialSettings().language,
+    initial.showGridLines,
   );
+  const [language, setLanguageState] = useState<Language>(initial.language);
   const [isDarkMode, setIsDarkMode] = useState<boolean>(() => {
     if (typeof window === 'undefined') return false;
-    const initial = loadInitialSettings().themeMode;
-    if (initial === 'system') {
+    if (initial.themeMode === 'system') {
       return window.matchMedia('(prefers-color-scheme: dark)').matches;
     }
-    return initial === 'dark';
+    return initial.themeMode === 'dark';
   });
   const [hasSeenConflictTip, setHasSeenConflictTip] = useState<boolean>(
-    () => loadInitialSettings().hasSeenConflictTip ?? false,
+    initial.hasSeenConflictTip ?? false,
   );
 
-  // Save settings to localStorage
+  // Save settings to localStorage. The stored object is re-read each time so
+  // fields changed by another open tab are not overwritten with stale values.
   const saveSettings = useCallback((settings: Partial<StoredSettings>) => {
     try {
       const current = localStorage.getItem(STORAGE_KEY);
@@ -124,74 +142,20 @@ export const SettingsProvider: React.FC<{ children: React.ReactNode }> = ({ chil
     }
   }, []);
 
-  // Load settings from localStorage once on mount
+  // Sync i18n and the document direction with the loaded settings once on
+  // mount, persisting the defaults when nothing valid was stored
   useEffect(() => {
+    const { settings, isDefault } = initialSettings;
+    if (isDefault) {
+      saveSettings(defaultSettings);
+    }
     try {
-      const stored = localStorage.getItem(STORAGE_KEY);
-      if (stored) {
-        const parsed: StoredSettings = JSON.parse(stored);
-
-        // If settings are from an older version, reset to new defaults
-        if (!parsed.version || parsed.version !== SETTINGS_VERSION) {
-          setFontSizeState(defaultSettings.fontSize);
-          setThemeModeState(defaultSettings.themeMode);
-          setShowGridLinesState(defaultSettings.showGridLines);
-          setLanguageState(defaultSettings.language);
-          saveSettings(defaultSettings);
-          try {
-            i18n.changeLanguage(defaultSettings.language);
-          } catch (e) {
-            console.error('Failed to change i18n language on load:', e);
-          }
-          if (typeof document !== 'undefined') {
-            document.documentElement.dir = 'rtl';
-            document.documentElement.lang = 'fa';
-          }
-          return;
-        }
-
-        setFontSizeState(parsed.fontSize || defaultSettings.fontSize);
-        setThemeModeState(parsed.themeMode || defaultSettings.themeMode);
-        setShowGridLinesState(
-          parsed.showGridLines ?? defaultSettings.showGridLines,
-        );
-        setLanguageState(parsed.language || defaultSettings.language);
-        setHasSeenConflictTip(
-          parsed.hasSeenConflictTip ?? defaultSettings.hasSeenConflictTip ?? false,
-        );
-
-        const lang = parsed.language || defaultSettings.language;
-        try {
-          i18n.changeLanguage(lang);
-        } catch (e) {
-          console.error('Failed to change i18n language on load:', e);
-        }
-        if (typeof document !== 'undefined') {
-          const dir = lang === 'fa' ? 'rtl' : 'ltr';
-          const htmlLang = lang === 'fa' ? 'fa' : 'en';
-          document.documentElement.dir = dir;
-          document.documentElement.lang = htmlLang;
-        }
-      } else {
-        // No stored settings: default to Persian (fa) and light theme
-        const defaultLang: Language = 'fa';
-        setLanguageState(defaultLang);
-        try {
-          i18n.changeLanguage(defaultLang);
-        } catch (e) {
-          console.error('Failed to set default i18n language:', e);
-        }
-        if (typeof document !== 'undefined') {
-          document.documentElement.dir = 'rtl';
-          document.documentElement.lang = 'fa';
-        }
-        // Persist initial defaults with version
-        saveSettings(defaultSettings);
-      }
+      i18n.changeLanguage(settings.language);
     } catch (e) {
-      console.error('Failed to load settings:', e);
+      console.error('Failed to change i18n language on load:', e);
     }
-  }, [saveSettings]);
+    applyDocumentLanguage(settings.language);
+  }, [initialSettings, saveSettings]);
 
   // Apply theme mode and track isDarkMode
   useEffect(() => {
@@ -235,6 +199,10 @@ export const SettingsProvider: React.FC<{ children: React.ReactNode }> = ({ chil
 
   const setLanguage = useCallback(
     (lang: Language) => {
+      // Re-selecting the current language would otherwise rewrite settings,
+      // re-run i18next's change cycle and re-render every translated view
+      if (lang === language) return;
+
       setLanguageState(lang);
       saveSettings({ language: lang });
 
@@ -244,14 +212,9 @@ export const SettingsProvider: React.FC<{ children: React.ReactNode }> = ({ chil
         console.error('Failed to change i18n language:', e);
       }
 
-      if (typeof document !== 'undefined') {
-        const dir = lang === 'fa' ? 'rtl' : 'ltr';
-        const htmlLang = lang === 'fa' ? 'fa' : 'en';
-        document.documentElement.dir = dir;
-        document.documentElement.lang = htmlLang;
-      }
+      applyDocumentLanguage(lang);
     },
-    [saveSettings],
+    [language, saveSettings],
   );
 
   const toggleLanguage = useCallback(() => {
@@ -45,9 +45,8 @@ export function useGolestanData(): UseGolestanDataResult {
 
     if (data) {
       for (const [facultyName, departmentsByName] of Object.entries(data)) {
-        if (!facultyNames.includes(facultyName)) {
-          facultyNames.push(facultyName);
-        }
+        // Object keys are unique, so no membership scan is needed here
+        facultyNames.push(facultyName);
         for (const [deptName, courses] of Object.entries(departmentsByName)) {
           const id = `${facultyName}:::${deptName}`;
           if (!seenDepartments.has(id)) {
@@ -1,5 +1,9 @@
 import type { Course } from '@/types/course';
-import { hasConflict as courseHasConflict } from '@/lib/scheduler';
+import {
+  hasConflict as courseHasConflict,
+  getSessionRanges,
+  type SessionRange,
+} from '@/lib/scheduler';
 
 export interface ScheduleCombination {
   courses: Course[];
@@ -9,47 +13,70 @@ export interface ScheduleCombination {
   score: number;
 }
 
+// Per-course bitmask of teaching days (bit d = day d), computed once per
+// Course object so combinations only need to OR a few integers together.
+const dayMaskCache = new WeakMap<Course, number>();
+
+function getDayMask(course: Course): number {
+  let mask = dayMaskCache.get(course);
+  if (mask === undefined) {
+    mask = 0;
+    for (const s of course.sessions) {
+      mask |= 1 << s.day;
+    }
+    dayMaskCache.set(course, mask);
+  }
+  return mask;
+}
+
 /**
  * Calculate number of distinct teaching days used by a combination.
  */
 function calculateDaysUsed(courses: Course[]): number {
-  const days = new Set<number>();
+  let mask = 0;
   for (const c of courses) {
-    for (const s of c.sessions) {
-      days.add(s.day);
-    }
+    mask |= getDayMask(c);
+  }
+  let count = 0;
+  while (mask) {
+    mask &= mask - 1;
+    count++;
   }
-  return days.size;
+  return count;
 }
 
 /**
  * Calculate total empty time (gaps) in hours across all days for a combination.
  * This is simplified from the Python implementation but preserves the idea:
  * sort sessions within each day by start, and sum gaps larger than 15 minutes.
+ * Uses the per-course minute ranges cached by the scheduler, bucketed into a
+ * day-indexed array instead of re-parsing session times per combination.
  */
 function calculateEmptyHours(courses: Course[]): number {
-  const byDay: Record<number, Array<{ start: number; end: number }>> = {};
+  const byDay: SessionRange[][] = [];
 
   for (const c of courses) {
-    for (const s of c.sessions) {
-      if (!byDay[s.day]) byDay[s.day] = [];
-      byDay[s.day].push({ start: s.startTime, end: s.endTime });
+    for (const range of getSessionRanges(c)) {
+      const intervals = byDay[range.day];
+      if (intervals) intervals.push(range);
+      else byDay[range.day] = [range];
     }
   }
 
-  let penalty = 0;
-  for (const intervals of Object.values(byDay)) {
+  let penaltyMinutes = 0;
+  for (const intervals of byDay) {
+    if (!intervals || intervals.length < 2) continue;
     intervals.sort((a, b) => a.start - b.start);
     for (let i = 0; i < intervals.length - 1; i++) {
-      const gapHours = intervals[i + 1].start - intervals[i].end;
-      // treat gaps > 0.25 hours (~15 minutes) as penalty
-      if (gapHours > 0.25) {
-        penalty += gapHours;
+      const gapMinutes = intervals[i + 1].start - intervals[i].end;
+      // treat gaps > 15 minutes as penalty
+      if (gapMinutes > 15) {
+        penaltyMinutes += gapMinutes;
       }
     }
   }
 
-  return penalty;
+  return penaltyMinutes / 60;
 }
 
 /**
@@ -79,6 +106,38 @@ export function generateBestCombinations(
   const groups = Array.from(groupsMap.values());
   const results: ScheduleCombination[] = [];
 
+  // Flatten all options so pairwise conflicts can be memoized by index.
+  // Conflicts are pairwise (time and exam), so checking a candidate against
+  // each chosen course individually is equivalent to checking it against
+  // the whole partial schedule.
+  const options: Course[] = [];
+  const groupOptionIndices: number[][] = groups.map(group =>
+    group.map(course => options.push(course) - 1),
+  );
+  const optionCount = options.length;
+  // 0 = not computed yet, 1 = conflict, 2 = compatible
+  const pairState = new Uint8Array(optionCount * optionCount);
+
+  function pairConflicts(a: number, b: number): boolean {
+    const cell = a * optionCount + b;
+    let state = pairState[cell];
+    if (state === 0) {
+      state = courseHasConflict([options[a]], options[b]).hasConflict ? 1 : 2;
+      pairState[cell] = state;
+      pairState[b * optionCount + a] = state;
+    }
+    return state === 1;
+  }
+
+  const chosen: number[] = [];
+
+  function conflictsWithChosen(index: number): boolean {
+    for (const other of chosen) {
+      if (pairConflicts(index, other)) return true;
+    }
+    return false;
+  }
+
   function backtrack(groupIndex: number, current: Course[]) {
     if (results.length >= maxCombinations) return;
 
@@ -95,16 +154,16 @@ export function generateBestCombinations(
     // Option 1: skip this group
     backtrack(groupIndex + 1, current);
 
-    // Option 2: try each course in this group
-    const group = groups[groupIndex];
-    for (const option of group) {
-      // Check conflicts against current schedule
-      const conflict = courseHasConflict(current, option);
-      if (conflict.hasConflict) continue;
+    // Option 2: try each course in this group, pruning on the first
+    // conflicting pair instead of re-checking the whole schedule
+    for (const index of groupOptionIndices[groupIndex]) {
+      if (conflictsWithChosen(index)) continue;
 
-      current.push(option);
+      chosen.push(index);
+      current.push(options[index]);
       backtrack(groupIndex + 1, current);
       current.pop();
+      chosen.pop();
     }
   }
 
@@ -6,6 +6,14 @@ import {
 } from '@/lib/utils/golestan';
 import { normalizeText } from '@/lib/textNormalizer';
 
+// Keyword alternations for mapGender / mapCourseType, so each text is
+// scanned once per category instead of once per keyword.
+const MALE_RE = /مرد|پسر|برادر|اقا|آقا/;
+const FEMALE_RE = /زن|دختر|خواهر|خانم/;
+const LAB_RE = /ازمايشگاه|کارگاه|کاراموزي/;
+const PRACTICAL_RE = /عملي|عملی/;
+const THEORETICAL_RE = /نظري|نظری/;
+
 /**
  * Map raw gender string from Golestan to internal Gender enum.
  * Falls back to 'mixed' when uncertain.
@@ -15,22 +23,11 @@ function mapGender(raw: string | undefined | null): Gender {
   const norm = normalizeText(raw);
 
   // Very simple heuristics; can be refined as we observe real values
-  if (
-    norm.includes('مرد') ||
-    norm.includes('پسر') ||
-    norm.includes('برادر') ||
-    norm.includes('اقا') ||
-    norm.includes('آقا')
-  ) {
+  if (MALE_RE.test(norm)) {
     return 'male';
   }
 
-  if (
-    norm.includes('زن') ||
-    norm.includes('دختر') ||
-    norm.includes('خواهر') ||
-    norm.includes('خانم')
-  ) {
+  if (FEMALE_RE.test(norm)) {
     return 'female';
   }
 
@@ -39,22 +36,17 @@ function mapGender(raw: string | undefined | null): Gender {
 
 /**
  * Map course type from name/description heuristics.
+ * `normName` is the course name already passed through normalizeText.
  * Default is 'theoretical'.
  */
-function mapCourseType(name: string, description?: string): CourseType {
-  const normName = normalizeText(name);
+function mapCourseType(normName: string, description?: string): CourseType {
   const normDesc = normalizeText(description || '');
 
   const text = `${normName} ${normDesc}`;
 
-  const hasLab =
-    text.includes('ازمايشگاه') || text.includes('کارگاه') || text.includes('کاراموزي');
-
-  const hasPractical =
-    text.includes('عملي') || text.includes('عملی');
-
-  const hasTheoretical =
-    text.includes('نظري') || text.includes('نظری');
+  const hasLab = LAB_RE.test(text);
+  const hasPractical = PRACTICAL_RE.test(text);
+  const hasTheoretical = THEORETICAL_RE.test(text);
 
   if ((hasLab || hasPractical) && hasTheoretical) {
     return 'both';
@@ -65,51 +57,60 @@ function mapCourseType(name: string, description?: string): CourseType {
   return 'theoretical';
 }
 
+// Keyword lists for mapCourseGroup, normalized once at module load (and
+// de-duplicated, since Arabic/Persian spellings collapse to the same form)
+// instead of on every course.
+const normalizeKeywords = (keywords: string[]): string[] =>
+  Array.from(new Set(keywords.map(k => normalizeText(k))));
+
+// General education (عمومی)
+const GENERAL_KEYWORDS = normalizeKeywords([
+  'عمومي',
+  'عمومی',
+  'معارف',
+  'اندیشه',
+  'انديشه',
+  'تربيت بدني',
+  'تربیت بدنی',
+  'فارسي عمومي',
+  'فارسی عمومی',
+  'انسانی',
+  'انسانشناسي',
+]);
+
+// Basic courses (ریاضی، فیزیک، شیمی، زبان عمومی، etc.)
+const BASIC_KEYWORDS = normalizeKeywords([
+  'رياضي',
+  'ریاضی',
+  'فيزيک',
+  'فیزیک',
+  'شيمي',
+  'شیمی',
+  'امار',
+  'آمار',
+  'زبان عمومي',
+  'زبان عمومی',
+]);
+
+const BASIC_FACULTY_KEYWORDS = normalizeKeywords(['علوم پايه', 'علوم پایه']);
+
 /**
  * Map course group (basic / general / specialized) based on name/faculty.
+ * `nameNorm` is the course name already passed through normalizeText.
  * Default is 'specialized'.
  */
-function mapCourseGroup(course: GolestanCourse): CourseGroup {
-  const nameNorm = normalizeText(course.name);
-  const facultyNorm = normalizeText(course.faculty || '');
-
-  // General education (عمومی)
-  const generalKeywords = [
-    'عمومي',
-    'عمومی',
-    'معارف',
-    'اندیشه',
-    'انديشه',
-    'تربيت بدني',
-    'تربیت بدنی',
-    'فارسي عمومي',
-    'فارسی عمومی',
-    'انسانی',
-    'انسانشناسي',
-  ];
-  if (generalKeywords.some(k => nameNorm.includes(normalizeText(k)))) {
+function mapCourseGroup(course: GolestanCourse, nameNorm: string): CourseGroup {
+  if (GENERAL_KEYWORDS.some(k => nameNorm.includes(k))) {
     return 'general';
   }
 
-  // Basic courses (ریاضی، فیزیک، شیمی، زبان عمومی، etc.)
-  const basicKeywords = [
-    'رياضي',
-    'ریاضی',
-    'فيزيک',
-    'فیزیک',
-    'شيمي',
-    'شیمی',
-    'امار',
-    'آمار',
-    'زبان عمومي',
-    'زبان عمومی',
-  ];
-  if (basicKeywords.some(k => nameNorm.includes(normalizeText(k)))) {
+  if (BASIC_KEYWORDS.some(k => nameNorm.includes(k))) {
     return 'basic';
   }
 
   // Fall back to faculty-based hints if needed (optional)
-  if (facultyNorm.includes('علوم پايه') || facultyNorm.includes('علوم پایه')) {
+  const facultyNorm = normalizeText(course.faculty || '');
+  if (BASIC_FACULTY_KEYWORDS.some(k => facultyNorm.includes(k))) {
     return 'basic';
   }
 
@@ -181,8 +182,10 @@ export function convertGolestanCourseToAppCourse(
   const capacity = Number.parseInt(gCourse.capacity, 10);
   const safeCapacity = Number.isFinite(capacity) ? capacity : 0;
 
+  // Normalize the name once; both the group and type heuristics use it
+  const normalizedName = normalizeText(gCourse.name);
   const gender = mapGender(gCourse.gender);
-  const group = mapCourseGroup(gCourse);
+  const group = mapCourseGroup(gCourse, normalizedName);
   // Prefer description; but also support legacy/backends that might send
   // a free-text field under alternative keys like `comment` or `note`.
   const rawDescription =
@@ -192,7 +195,7 @@ export function convertGolestanCourseToAppCourse(
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
     (gCourse as any).note ||
     '';
-  const type = mapCourseType(gCourse.name, rawDescription);
+  const type = mapCourseType(normalizedName, rawDescription);
 
   const facultyName = faculty ?? gCourse.faculty ?? '';
   const deptName = department ?? gCourse.department ?? '';
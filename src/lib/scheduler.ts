@@ -7,46 +7,172 @@ export interface ConflictResult {
   conflictWith?: string;
 }
 
+// WeekType as bit flags: 'both' is the union of the two parities, so two
+// sessions share a week exactly when their flags intersect.
+const WEEK_ODD = 1;
+const WEEK_EVEN = 2;
+const WEEK_BOTH = WEEK_ODD | WEEK_EVEN;
+
+const WEEK_TYPE_BITS: Record<WeekType, number> = {
+  odd: WEEK_ODD,
+  even: WEEK_EVEN,
+  both: WEEK_BOTH,
+};
+
 /**
- * Check if two WeekType values conflict.
+ * Check if two week flag sets conflict.
  * Semantics:
  * - 'both' conflicts with any concrete type
  * - concrete types conflict with themselves
  * - 'odd' vs 'even' is compatible
  */
-function weekTypesConflict(type1: WeekType, type2: WeekType): boolean {
-  if (type1 === 'both' || type2 === 'both') return true;
-  return type1 === type2;
+function weekTypesConflict(weeks1: number, weeks2: number): boolean {
+  return (weeks1 & weeks2) !== 0;
+}
+
+export interface SessionRange {
+  day: number;
+  start: number; // minutes since midnight
+  end: number;   // minutes since midnight
+  weeks: number; // WEEK_* flags derived from the session's WeekType
+}
+
+// Per-course minute ranges, computed once per Course object. Courses are
+// treated as immutable by the UI (edits produce new objects), so caching by
+// identity is safe and lets the conflict checks skip time parsing entirely.
+const sessionRangeCache = new WeakMap<Course, SessionRange[]>();
+
+/**
+ * Convert a CourseSession time (hour number such as 8 or 9.5, or an
+ * "HH:MM" string) to minutes since midnight. Returns NaN when invalid.
+ */
+function sessionTimeToMinutes(value: number | string): number {
+  if (typeof value === 'number') {
+    return Number.isFinite(value) ? Math.round(value * 60) : NaN;
+  }
+  return timeToMinutes(value);
+}
+
+/**
+ * Return the valid sessions of a course as integer minute ranges.
+ * Sessions with unparseable times are dropped, matching the previous
+ * behaviour of skipping them during conflict checks.
+ */
+export function getSessionRanges(course: Course): SessionRange[] {
+  const cached = sessionRangeCache.get(course);
+  if (cached) return cached;
+
+  const ranges: SessionRange[] = [];
+  for (const session of course.sessions) {
+    const start = sessionTimeToMinutes(session.startTime);
+    const end = sessionTimeToMinutes(session.endTime);
+    if (!Number.isFinite(start) || !Number.isFinite(end)) continue;
+    // Unknown week types are treated as 'both' (the conservative choice)
+    const weeks = WEEK_TYPE_BITS[session.weekType] ?? WEEK_BOTH;
+    ranges.push({ day: session.day, start, end, weeks });
+  }
+
+  sessionRangeCache.set(course, ranges);
+  return ranges;
+}
+
+// Number of weekday columns covered by the occupancy masks (Saturday–Friday).
+const MASK_DAYS = 7;
+
+/**
+ * Hour-granularity occupancy of a course, one bitmask per day for each
+ * parity class (bit h = the hour starting at h:00). A session marks every
+ * hour it touches, so two courses whose masks do not intersect cannot have
+ * a time conflict. `null` means the course has sessions the masks cannot
+ * represent and callers must fall back to the exact minute comparison.
+ */
+interface OccupancyMask {
+  odd: number[];
+  even: number[];
+}
+
+const occupancyCache = new WeakMap<Course, OccupancyMask | null>();
+
+function buildOccupancyMask(course: Course): OccupancyMask | null {
+  const odd = new Array<number>(MASK_DAYS).fill(0);
+  const even = new Array<number>(MASK_DAYS).fill(0);
+
+  for (const range of getSessionRanges(course)) {
+    if (!Number.isInteger(range.day) || range.day < 0 || range.day >= MASK_DAYS) {
+      return null;
+    }
+    if (range.start < 0 || range.end > 24 * 60 || range.end <= range.start) {
+      return null;
+    }
+
+    const firstHour = Math.floor(range.start / 60);
+    const lastHour = Math.ceil(range.end / 60);
+    const bits = ((1 << (lastHour - firstHour)) - 1) << firstHour;
+
+    if (range.weeks & WEEK_ODD) odd[range.day] |= bits;
+    if (range.weeks & WEEK_EVEN) even[range.day] |= bits;
+  }
+
+  return { odd, even };
+}
+
+function getOccupancyMask(course: Course): OccupancyMask | null {
+  if (occupancyCache.has(course)) return occupancyCache.get(course) ?? null;
+  const mask = buildOccupancyMask(course);
+  occupancyCache.set(course, mask);
+  return mask;
+}
+
+/**
+ * Cheap pre-check: false only when the two courses definitely share no
+ * hour in a compatible parity class.
+ */
+function mayOverlap(a: Course, b: Course): boolean {
+  const maskA = getOccupancyMask(a);
+  const maskB = getOccupancyMask(b);
+  if (!maskA || !maskB) return true;
+
+  for (let day = 0; day < MASK_DAYS; day++) {
+    if ((maskA.odd[day] & maskB.odd[day]) | (maskA.even[day] & maskB.even[day])) {
+      return true;
+    }
+  }
+  return false;
 }
 
 /**
  * Check time conflict between two courses based on their sessions.
- * Uses timeToMinutes + checkTimeOverlap from golestan utils.
+ * Session times are pre-converted to minutes once per course, so the
+ * inner loop is pure integer comparisons; course pairs whose occupancy
+ * masks are disjoint skip the pairwise session loop entirely.
  */
 function hasTimeConflict(
   current: Course[],
   candidate: Course,
 ): ConflictResult {
-  for (const existing of current) {
-    for (const newSession of candidate.sessions) {
-      for (const existingSession of existing.sessions) {
-        if (newSession.day !== existingSession.day) continue;
+  const candidateRanges = getSessionRanges(candidate);
+  if (candidateRanges.length === 0) return { hasConflict: false };
 
-        const start1 = timeToMinutes(`${newSession.startTime.toString().padStart(2, '0')}:00`);
-        const end1 = timeToMinutes(`${newSession.endTime.toString().padStart(2, '0')}:00`);
-        const start2 = timeToMinutes(`${existingSession.startTime.toString().padStart(2, '0')}:00`);
-        const end2 = timeToMinutes(`${existingSession.endTime.toString().padStart(2, '0')}:00`);
+  for (const existing of current) {
+    if (!mayOverlap(candidate, existing)) continue;
 
-        if (!Number.isFinite(start1) || !Number.isFinite(end1) ||
-            !Number.isFinite(start2) || !Number.isFinite(end2)) {
-          continue;
-        }
+    const existingRanges = getSessionRanges(existing);
+    for (const newRange of candidateRanges) {
+      for (const existingRange of existingRanges) {
+        if (newRange.day !== existingRange.day) continue;
 
-        if (!checkTimeOverlap(start1, end1, start2, end2)) {
+        if (
+          !checkTimeOverlap(
+            newRange.start,
+            newRange.end,
+            existingRange.start,
+            existingRange.end,
+          )
+        ) {
           continue;
         }
 
-        if (weekTypesConflict(newSession.weekType, existingSession.weekType)) {
+        if (weekTypesConflict(newRange.weeks, existingRange.weeks)) {
           return {
             hasConflict: true,
             reason: 'time',
@@ -2,6 +2,7 @@ import type { Credentials, Student } from '@/types/student';
 
 const CREDENTIALS_KEY = 'golestoon_student_credentials';
 const STUDENT_KEY = 'golestoon_student_profile';
+const CREDENTIALS_VERSION = 2;
 
 // Very lightweight obfuscation to avoid plain-text storage.
 // NOTE: This is not real cryptographic security, but better than nothing
@@ -24,26 +25,46 @@ function decode(value: string): string {
   }
 }
 
+// JSON with non-ASCII characters escaped, so the blob is always safe for btoa
+function toAsciiJson(value: unknown): string {
+  return JSON.stringify(value).replace(
+    /[\u007f-\uffff]/g,
+    ch => `\\u${ch.charCodeAt(0).toString(16).padStart(4, '0')}`,
+  );
+}
+
 export function saveCredentials(creds: Credentials): void {
   if (typeof window === 'undefined') return;
 
+  // v2: both fields are obfuscated together as one blob (one encode pass)
   const payload = {
-    username: encode(creds.username),
-    password: encode(creds.password),
+    v: CREDENTIALS_VERSION,
+    data: encode(toAsciiJson({ u: creds.username, p: creds.password })),
     rememberMe: creds.rememberMe,
   };
 
   const serialized = JSON.stringify(payload);
 
-  // Always clear both first to avoid duplicates
-  window.localStorage.removeItem(CREDENTIALS_KEY);
-  window.sessionStorage.removeItem(CREDENTIALS_KEY);
+  invalidateCredentialsCache();
 
-  if (creds.rememberMe) {
-    window.localStorage.setItem(CREDENTIALS_KEY, serialized);
-  } else {
-    window.sessionStorage.setItem(CREDENTIALS_KEY, serialized);
-  }
+  // setItem overwrites the target storage, so only the other one needs
+  // clearing to avoid duplicates
+  const target = creds.rememberMe ? window.localStorage : window.sessionStorage;
+  const other = creds.rememberMe ? window.sessionStorage : window.localStorage;
+
+  other.removeItem(CREDENTIALS_KEY);
+  target.setItem(CREDENTIALS_KEY, serialized);
+}
+
+// Last decoded credentials, keyed by the raw stored string they came from.
+// Repeated reads of unchanged storage skip JSON parsing and decoding; a
+// different raw value (including one written by another tab) re-parses.
+let cachedCredentialsRaw: string | null = null;
+let cachedCredentials: Credentials | null = null;
+
+function invalidateCredentialsCache(): void {
+  cachedCredentialsRaw = null;
+  cachedCredentials = null;
 }
 
 export function getCredentials(): Credentials | null {
@@ -55,18 +76,40 @@ export function getCredentials(): Credentials | null {
 
   if (!raw) return null;
 
+  if (raw === cachedCredentialsRaw && cachedCredentials) {
+    return { ...cachedCredentials };
+  }
+
   try {
     const parsed = JSON.parse(raw) as {
-      username: string;
-      password: string;
+      v?: number;
+      data?: string;
+      username?: string;
+      password?: string;
       rememberMe: boolean;
     };
 
-    return {
-      username: decode(parsed.username),
-      password: decode(parsed.password),
+    let username: string;
+    let password: string;
+    if (parsed.v === CREDENTIALS_VERSION && parsed.data) {
+      const fields = JSON.parse(decode(parsed.data)) as { u: string; p: string };
+      username = fields.u;
+      password = fields.p;
+    } else {
+      // Legacy format: each field obfuscated separately
+      username = decode(parsed.username ?? '');
+      password = decode(parsed.password ?? '');
+    }
+
+    const creds: Credentials = {
+      username,
+      password,
       rememberMe: parsed.rememberMe ?? false,
     };
+
+    cachedCredentialsRaw = raw;
+    cachedCredentials = creds;
+    return { ...creds };
   } catch {
     return null;
   }
@@ -74,6 +117,7 @@ export function getCredentials(): Credentials | null {
 
 export function clearCredentials(): void {
   if (typeof window === 'undefined') return;
+  invalidateCredentialsCache();
   window.localStorage.removeItem(CREDENTIALS_KEY);
   window.sessionStorage.removeItem(CREDENTIALS_KEY);
 }
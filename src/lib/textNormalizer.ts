@@ -1,3 +1,63 @@
+import type { Course } from '@/types/course';
+
+// Lookup tables and patterns are built once at module load; normalizeText
+// runs for every course name, instructor and code when the catalogue loads.
+
+// Persian (۰-۹) and Arabic-Indic (٠-٩) digits → ASCII digits
+const DIGIT_MAP: Record<string, string> = (() => {
+  const persianDigits = '۰۱۲۳۴۵۶۷۸۹';
+  const arabicDigits = '٠١٢٣٤٥٦٧٨٩';
+  const map: Record<string, string> = {};
+  for (let i = 0; i < 10; i++) {
+    map[persianDigits[i]] = String(i);
+    map[arabicDigits[i]] = String(i);
+  }
+  return map;
+})();
+
+// Common Arabic characters → Persian equivalents
+const ARABIC_CHAR_MAP: Record<string, string> = {
+  'ي': 'ی',
+  'ى': 'ی',
+  'ئ': 'ی',
+  'ك': 'ک',
+  'ؤ': 'و',
+  'إ': 'ا',
+  'أ': 'ا',
+  'آ': 'ا',
+  'ۀ': 'ه',
+  'ة': 'ه',
+  'ء': '',
+};
+
+// Every single-character rewrite in one table, applied in a single pass:
+// digits, Arabic letters, invisible/formatting marks (ZWNJ, ZWJ, kashida,
+// LRM, RLM) removed, dashes/underscore → space, quotes removed. None of the
+// outputs is itself a key, so one pass gives the same result as chaining.
+const CHAR_MAP: Record<string, string> = {
+  ...DIGIT_MAP,
+  ...ARABIC_CHAR_MAP,
+  '\u200c': '',
+  '\u200d': '',
+  'ـ': '',
+  '\u200e': '',
+  '\u200f': '',
+  '–': ' ',
+  '—': ' ',
+  '-': ' ',
+  '_': ' ',
+  '"': '',
+  "'": '',
+};
+
+const PAREN_ANNOTATION_RE = /\([^)]*\)/g;
+const SQUARE_ANNOTATION_RE = /\[[^\]]*]/g;
+const CURLY_ANNOTATION_RE = /\{[^}]*}/g;
+const WHITESPACE_RE = /\s+/g;
+// Stray brackets plus Persian punctuation, deleted together in one pass
+const STRIP_CHARS_RE = /[()\[\]{}،؛:٬«»]/g;
+const ISLAM_TYPO_RE = /اسالم/g;
+
 /**
  * Normalize Persian/Arabic text for robust comparison and matching.
  * Ported from _reference_logic/core/text_normalizer.py::normalize_persian_text
@@ -18,79 +78,52 @@ export function normalizeText(text: string): string {
     return '';
   }
 
-  // Convert Persian/Arabic digits to English digits
-  const persianDigits = '۰۱۲۳۴۵۶۷۸۹';
-  const arabicDigits = '٠١٢٣٤٥٦٧٨٩';
-  const englishDigits = '0123456789';
-
-  const persianToEnglish: Record<string, string> = {};
-  const arabicToEnglish: Record<string, string> = {};
-
-  for (let i = 0; i < englishDigits.length; i++) {
-    persianToEnglish[persianDigits[i]] = englishDigits[i];
-    arabicToEnglish[arabicDigits[i]] = englishDigits[i];
+  // Digits, Arabic letters, invisible marks, dashes and quotes in one pass
+  let mapped = '';
+  for (const ch of result) {
+    const replacement = CHAR_MAP[ch];
+    mapped += replacement === undefined ? ch : replacement;
   }
-
-  result = result
-    .split('')
-    .map((ch) => persianToEnglish[ch] ?? arabicToEnglish[ch] ?? ch)
-    .join('');
-
-  // Normalize common Arabic characters to Persian equivalents
-  const arabicCharMap: Record<string, string> = {
-    'ي': 'ی',
-    'ى': 'ی',
-    'ئ': 'ی',
-    'ك': 'ک',
-    'ؤ': 'و',
-    'إ': 'ا',
-    'أ': 'ا',
-    'آ': 'ا',
-    'ۀ': 'ه',
-    'ة': 'ه',
-    'ء': '',
-  };
-
-  result = result
-    .split('')
-    .map((ch) => arabicCharMap[ch] ?? ch)
-    .join('');
-
-  // Remove/normalize zero-width and formatting characters
-  result = result
-    .replace(/\u200c/g, '') // ZWNJ
-    .replace(/\u200d/g, '') // ZWJ
-    .replace(/ـ/g, '') // kashida
-    .replace(/‌/g, '') // explicit ZWNJ used in some fonts
-    .replace(/‎/g, '') // LRM
-    .replace(/‏/g, ''); // RLM
-
-  // Normalize various dash/underscore characters to spaces
-  result = result
-    .replace(/–/g, ' ')
-    .replace(/—/g, ' ')
-    .replace(/-/g, ' ')
-    .replace(/_/g, ' ');
-
-  // Strip quotes
-  result = result.replace(/["']/g, '');
+  result = mapped;
 
   // Remove bracketed/parenthetical annotations entirely
   result = result
-    .replace(/\([^)]*\)/g, ' ')
-    .replace(/\[[^\]]*]/g, ' ')
-    .replace(/\{[^}]*}/g, ' ');
+    .replace(PAREN_ANNOTATION_RE, ' ')
+    .replace(SQUARE_ANNOTATION_RE, ' ')
+    .replace(CURLY_ANNOTATION_RE, ' ');
 
   // Collapse whitespace
-  result = result.replace(/\s+/g, ' ').trim();
+  result = result.replace(WHITESPACE_RE, ' ').trim();
 
   // Remove remaining bracket and punctuation characters used in Persian
-  result = result
-    .replace(/[()\[\]{}()]/g, '')
-    .replace(/[،؛:؛٬«»]/g, '');
+  result = result.replace(STRIP_CHARS_RE, '');
 
   // Fix common OCR/typo variant
-  result = result.replace(/اسالم/g, 'اسلام');
+  result = result.replace(ISLAM_TYPO_RE, 'اسلام');
 
   return result.toLowerCase();
-}
\ No newline at end of file
+}
+
+/**
+ * Pre-normalized search text for a course: name, instructor and code joined
+ * with '\n'. normalizeText collapses all whitespace to single spaces, so a
+ * normalized query can never contain '\n' and a substring match cannot span
+ * two fields.
+ */
+export function buildCourseSearchText(
+  course: Pick<Course, 'name' | 'instructor' | 'courseId'>,
+): string {
+  return `${normalizeText(course.name)}\n${normalizeText(course.instructor)}\n${normalizeText(course.courseId)}`;
+}
+
+/**
+ * Map each course to its buildCourseSearchText string, so a course list is
+ * normalized once rather than on every search keystroke.
+ */
+export function buildCourseSearchIndex(courses: Course[]): Map<Course, string> {
+  const index = new Map<Course, string>();
+  for (const course of courses) {
+    index.set(course, buildCourseSearchText(course));
+  }
+  return index;
+}
@@ -1,11 +1,43 @@
 import { clsx, type ClassValue } from "clsx";
 import { twMerge } from "tailwind-merge";
-import * as htmlToImage from "html-to-image";
+import type { Course } from "@/types/course";
 
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs));
 }
 
+let lastLocalId = 0;
+
+/**
+ * Timestamp-based id for locally created records (saved schedules, custom
+ * courses). Strictly increasing within the page, so two records created in
+ * the same millisecond never share an id.
+ */
+export function createLocalId(): string {
+  lastLocalId = Math.max(Date.now(), lastLocalId + 1);
+  return lastLocalId.toString();
+}
+
+/**
+ * Split a (filtered) course list into the sidebar sections in a single pass:
+ * user-added custom courses, courses available to take, and other courses.
+ */
+export function partitionCourses(courses: Course[]): {
+  custom: Course[];
+  available: Course[];
+  other: Course[];
+} {
+  const custom: Course[] = [];
+  const available: Course[] = [];
+  const other: Course[] = [];
+  for (const c of courses) {
+    if (c.departmentId === "custom") custom.push(c);
+    else if (c.category === "available") available.push(c);
+    else if (c.category === "other") other.push(c);
+  }
+  return { custom, available, other };
+}
+
 /**
  * Capture the schedule grid and download it as a high‑quality PNG image.
  *
@@ -20,6 +52,10 @@ export const downloadScheduleImage = async (
   const element = document.getElementById(elementId) as HTMLElement | null;
   if (!element) return;
 
+  // Loaded on demand: utils.ts is imported everywhere for `cn`, and the
+  // exporter is only needed when the user actually downloads an image
+  const htmlToImage = await import("html-to-image");
+
   // Wait for fonts to be ready to avoid text glitches
   if ((document as any).fonts?.ready) {
     try {
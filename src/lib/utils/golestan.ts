@@ -10,6 +10,15 @@ export interface ParsedExamTime {
   end: number;   // minutes since midnight
 }
 
+// Patterns shared by the parsers below, compiled once at module load
+const TIME_RE = /^(\d{1,2}):(\d{2})$/;
+// Match: YYYY/MM/DD ... HH:MM-HH:MM
+const EXAM_TIME_RE = /(\d{4}\/\d{2}\/\d{2}).*?(\d{2}:\d{2})-(\d{2}:\d{2})/;
+// Whitespace and ZWNJ, removed to build compact day-name keys
+const DAY_NAME_SPACING_RE = /[\s\u200c]+/g;
+const ARABIC_YEH_RE = /ي/g;
+const ARABIC_KAF_RE = /ك/g;
+
 /**
  * Convert a time string "HH:MM" to minutes since midnight.
  * Returns NaN if the input is invalid.
@@ -19,7 +28,7 @@ export function timeToMinutes(timeStr: string | null | undefined): number {
   const trimmed = timeStr.trim();
   if (!trimmed) return NaN;
 
-  const match = trimmed.match(/^(\d{1,2}):(\d{2})$/);
+  const match = trimmed.match(TIME_RE);
   if (!match) return NaN;
 
   const hours = Number.parseInt(match[1], 10);
@@ -52,10 +61,7 @@ export function parseExamTime(
   const text = examStr.trim();
   if (!text) return null;
 
-  // Match: YYYY/MM/DD ... HH:MM-HH:MM
-  const match = text.match(
-    /(\d{4}\/\d{2}\/\d{2}).*?(\d{2}:\d{2})-(\d{2}:\d{2})/,
-  );
+  const match = text.match(EXAM_TIME_RE);
   if (!match) return null;
 
   const [, date, startStr, endStr] = match;
@@ -135,6 +141,22 @@ export function checkParityConflict(
   return true;
 }
 
+// Compact day-name keys (no spaces/ZWNJ, Persian ی/ک) → grid column index.
+// Friday (جمعه) is intentionally absent since the grid does not show it.
+const DAY_INDEX_BY_KEY = new Map<string, number>([
+  ['شنبه', 0],
+  ['یکشنبه', 1],
+  ['دوشنبه', 2],
+  ['سهشنبه', 3], // سه‌شنبه
+  ['چهارشنبه', 4],
+  ['پنجشنبه', 5], // پنج‌شنبه
+]);
+
+// Memo of raw day strings as they appear in API data. Only a handful of
+// spellings exist in practice; the limit just guards against junk input.
+const DAY_NAME_CACHE_LIMIT = 64;
+const dayIndexByRawName = new Map<string, number | null>();
+
 /**
  * Convert Persian weekday name to a day index compatible with the UI grid.
  *
@@ -151,33 +173,21 @@ export function checkParityConflict(
 export function dayNameToIndex(dayName: string | null | undefined): number | null {
   if (!dayName) return null;
 
+  // Raw day strings repeat for every session, so resolve each spelling once
+  const cached = dayIndexByRawName.get(dayName);
+  if (cached !== undefined) return cached;
+
   // Normalize Arabic forms and remove spaces/ZWNJ to create a compact key
-  let key = dayName
-    .replace(/\s+/g, '')
-    .replace(/\u200c/g, '')
-    .replace(/ي/g, 'ی')
-    .replace(/ك/g, 'ک')
-    .trim();
-
-  switch (key) {
-    case 'شنبه':
-      return 0;
-    case 'یکشنبه':
-    case 'يكشنبه':
-      return 1;
-    case 'دوشنبه':
-      return 2;
-    case 'سهشنبه':
-      return 3; // سه‌شنبه
-    case 'چهارشنبه':
-      return 4;
-    case 'پنجشنبه':
-      return 5; // پنج‌شنبه
-    case 'جمعه':
-      return null; // Friday not shown in current grid
-    default:
-      return null;
+  const key = dayName
+    .replace(DAY_NAME_SPACING_RE, '')
+    .replace(ARABIC_YEH_RE, 'ی')
+    .replace(ARABIC_KAF_RE, 'ک');
+
+  const index = DAY_INDEX_BY_KEY.get(key) ?? null;
+  if (dayIndexByRawName.size < DAY_NAME_CACHE_LIMIT) {
+    dayIndexByRawName.set(dayName, index);
   }
+  return index;
 }
 
 /**